@@ -10,6 +10,11 @@
 {{
   config(
     materialized='table',
+    partition_by={
+      'field': 'order_date',
+      'data_type': 'date'
+    },
+    cluster_by=['customer_state', 'seller_state', 'order_status'],
     description='Delivery analytics OBT - simplified version without timestamp operations'
   )
 }}